@@ -15,15 +15,68 @@ Metrics computed:
 - VR (Voicing Recall): Voicing recall rate
 """
 
+import os
 from src.evaluation import PitchEvaluator
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# 50 cents tolerance (quarter tone)
+PITCH_TOLERANCE = 50.0
+
+
+def _evaluate_one(exp_name, config, tolerance):
+    """
+    Evaluate a single experimental condition.
+    
+    Runs in a worker process, so a fresh evaluator is built here.
+    
+    Returns:
+        True if the condition was evaluated, False if skipped or failed
+    """
+    pred_dir = Path(config['prediction_dir'])
+    
+    # Check if prediction directory exists and has files
+    if not pred_dir.is_dir():
+        print(f"⚠ Skipping {exp_name}: Prediction directory not found")
+        print(f"  {pred_dir}\n")
+        return False
+    
+    # Single scandir pass; DirEntry names avoid per-entry Path/stat work.
+    # An empty directory is detected from the first entry without listing the rest.
+    try:
+        with os.scandir(pred_dir) as entries:
+            csv_entries = (entry for entry in entries if entry.name.endswith('.csv'))
+            first = next(csv_entries, None)
+            pred_files = [] if first is None else [first.path, *(entry.path for entry in csv_entries)]
+    except OSError:
+        pred_files = []
+    if not pred_files:
+        print(f"⚠ Skipping {exp_name}: No prediction files found")
+        print(f"  {pred_dir}\n")
+        return False
+    
+    print(f"\n{'='*60}")
+    print(f"Evaluating: {exp_name}")
+    print(f"{'='*60}")
+    print(f"Prediction files: {len(pred_files)}")
+    
+    evaluator = PitchEvaluator(pitch_tolerance=tolerance)
+    try:
+        evaluator.evaluate(
+            prediction_dir=config['prediction_dir'],
+            ground_truth_dir=config['ground_truth_dir'],
+            output_path=config['output_path']
+        )
+    except Exception as e:
+        print(f"\n✗ Error evaluating {exp_name}: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    return True
 
 
 def main():
     """Main evaluation function."""
-    # Initialize evaluator with 50 cents tolerance (quarter tone)
-    evaluator = PitchEvaluator(pitch_tolerance=50.0)
-    
     # Define experimental conditions
     experiments = {
         'clean': {
@@ -64,37 +117,24 @@ def main():
     print(f"\nTolerance: 50 cents (quarter tone)")
     print(f"Metrics: OA, RPA, RCA, VR\n")
     
-    # Evaluate each experimental condition
-    for exp_name, config in experiments.items():
-        pred_dir = Path(config['prediction_dir'])
-        
-        # Check if prediction directory exists and has files
-        if not pred_dir.exists():
-            print(f"⚠ Skipping {exp_name}: Prediction directory not found")
-            print(f"  {pred_dir}\n")
-            continue
-        
-        pred_files = list(pred_dir.glob("*.csv"))
-        if len(pred_files) == 0:
-            print(f"⚠ Skipping {exp_name}: No prediction files found")
-            print(f"  {pred_dir}\n")
-            continue
-        
-        print(f"\n{'='*60}")
-        print(f"Evaluating: {exp_name}")
-        print(f"{'='*60}")
-        print(f"Prediction files: {len(pred_files)}")
-        
-        try:
-            evaluator.evaluate(
-                prediction_dir=config['prediction_dir'],
-                ground_truth_dir=config['ground_truth_dir'],
-                output_path=config['output_path']
-            )
-        except Exception as e:
-            print(f"\n✗ Error evaluating {exp_name}: {e}")
-            import traceback
-            traceback.print_exc()
+    # Conditions are independent, so evaluate them concurrently
+    max_workers = min(len(experiments), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_evaluate_one, exp_name, config, PITCH_TOLERANCE): exp_name
+            for exp_name, config in experiments.items()
+        }
+        for future in as_completed(futures):
+            exp_name = futures[future]
+            # A failure in one condition (including a crashed worker) must
+            # not stop the others from being reported
+            try:
+                finished = future.result()
+            except Exception as e:
+                print(f"\n✗ Error evaluating {exp_name}: {e}")
+                continue
+            if finished:
+                print(f"✓ Finished: {exp_name}")
     
     print("\n" + "=" * 60)
     print("Evaluation Complete")
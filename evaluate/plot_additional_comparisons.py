@@ -7,37 +7,57 @@ Plot additional comparison figures:
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
-# Try to import seaborn for better styling (optional)
+# matplotlib (and optional seaborn) are imported on first plot by
+# AdditionalPlotter._lazy_init_mpl() to keep module import cheap
+plt = None
+HAS_SEABORN = False
+
+# Try to import pyarrow for faster CSV parsing (optional)
 try:
-    import seaborn as sns
-    sns.set_style("whitegrid")
-    HAS_SEABORN = True
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    HAS_PYARROW = True
 except ImportError:
-    HAS_SEABORN = False
+    HAS_PYARROW = False
+
+# Trailing extensions stripped from result filenames to get the manifest track_id
+TRACK_ID_SUFFIX_PATTERN = r'(?:\.wav)?(?:\.csv)?$'
 
-# Set matplotlib style
-plt.rcParams['figure.figsize'] = (14, 8)
-plt.rcParams['font.size'] = 10
-plt.style.use('default')
+# Y-axis ticks shared by every metric plot (all metrics are in [0, 1])
+YTICKS = np.linspace(0, 1, 11)
+YTICK_LABELS = [f'{v:.1f}' for v in YTICKS]
 
 
 class AdditionalPlotter:
     """Plot additional comparisons based on manifest classifications."""
     
-    def __init__(self, results_dir: str = "results/metrics", manifests_dir: str = "MedleyDB-Pitch-Experiments/manifests"):
+    METRIC_FULL_NAMES = {
+        'OA': 'Overall Accuracy',
+        'RPA': 'Raw Pitch Accuracy',
+        'RCA': 'Raw Chroma Accuracy',
+        'VR': 'Voicing Recall'
+    }
+    
+    def __init__(self,
+                 results_dir: str = "results/metrics",
+                 manifests_dir: str = "MedleyDB-Pitch-Experiments/manifests",
+                 dpi: int = 150):
         """
         Initialize plotter.
         
         Args:
             results_dir: Directory containing evaluation result CSV files
             manifests_dir: Directory containing manifest CSV files
+            dpi: Resolution of saved figures (scatter points are rasterized)
         """
         self.results_dir = Path(results_dir)
         self.manifests_dir = Path(manifests_dir)
+        self.dpi = dpi
         self.metrics = ['OA', 'RPA', 'RCA', 'VR']
         self.models = ['librosa', 'crepe', 'basic_pitch']
         self.colors = {
@@ -45,27 +65,118 @@ class AdditionalPlotter:
             'crepe': '#ff7f0e',        # Orange
             'basic_pitch': '#2ca02c'   # Green
         }
+        
+        # Result file conditions and the manifest each one is merged with
+        self.result_sources = [
+            ('clean', None),
+            ('distortion', 'distortion'),
+            ('noise_5db', 'noise'),
+            ('noise_15db', 'noise'),
+            ('pitch_shift_25cents', 'tuning'),
+            ('pitch_shift_50cents', 'tuning')
+        ]
+        
+        # Manifest file names (tuning is used for class_tag only)
+        self.manifest_files = {
+            'distortion': 'manifest_dist.csv',
+            'noise': 'manifest_noise.csv',
+            'tuning': 'manifest_tuning.csv'
+        }
+        
+        # Manifest columns merged into the results, keyed by manifest
+        self.manifest_columns = {
+            'distortion': ['track_id', 'level_tag', 'class_tag'],
+            'noise': ['track_id', 'noise_tag', 'class_tag'],
+            'tuning': ['track_id', 'class_tag']
+        }
+    
+    @classmethod
+    def _lazy_init_mpl(cls):
+        """Import matplotlib/seaborn and apply the plot style (once)."""
+        global plt, HAS_SEABORN
+        if plt is not None:
+            return
+        
+        # Figures are only ever saved to disk, so use the non-interactive Agg
+        # backend instead of probing for a display (safe on headless servers)
+        import matplotlib
+        matplotlib.use('Agg', force=True)
+        import matplotlib.pyplot as pyplot
+        pyplot.ioff()
+        
+        # Try to import seaborn for better styling (optional)
+        try:
+            import seaborn as sns
+            sns.set_style("whitegrid")
+            HAS_SEABORN = True
+        except ImportError:
+            HAS_SEABORN = False
+        
+        # Set matplotlib style
+        pyplot.rcParams['figure.figsize'] = (14, 8)
+        pyplot.rcParams['font.size'] = 10
+        pyplot.style.use('default')
+        plt = pyplot
     
     def load_manifests(self) -> Dict[str, pd.DataFrame]:
-        """Load all manifest files."""
-        manifests = {}
+        """Load all manifest files (read concurrently, since this is I/O bound)."""
+        existing = {key: self.manifests_dir / filename
+                    for key, filename in self.manifest_files.items()
+                    if (self.manifests_dir / filename).exists()}
+        if not existing:
+            return {}
+        
+        # Only the columns merged into the results are parsed
+        def read_manifest(key):
+            return pd.read_csv(existing[key], usecols=self.manifest_columns[key])
+        
+        with ThreadPoolExecutor(max_workers=len(existing)) as executor:
+            frames = executor.map(read_manifest, existing.keys())
+        return dict(zip(existing.keys(), frames))
+    
+    def _read_table(self, file_path: Path) -> 'pa.Table':
+        """
+        Read the filename and metric columns of a result CSV into an Arrow
+        table, dropping the AVERAGE summary row before it reaches pandas.
+        """
+        column_types = {'filename': pa.string()}
+        column_types.update({metric: pa.float64() for metric in self.metrics})
+        table = pacsv.read_csv(file_path,
+                               read_options=pacsv.ReadOptions(use_threads=True),
+                               convert_options=pacsv.ConvertOptions(
+                                   include_columns=list(column_types),
+                                   column_types=column_types))
+        return table.filter(pc.not_equal(table['filename'], 'AVERAGE'))
+    
+    def _read_results(self, sources: List[tuple]) -> pd.DataFrame:
+        """
+        Read result CSVs into one long-form DataFrame.
         
-        # Load distortion manifest
-        dist_file = self.manifests_dir / 'manifest_dist.csv'
-        if dist_file.exists():
-            manifests['distortion'] = pd.read_csv(dist_file)
+        With PyArrow, the per-file tables are stitched together with
+        pa.concat_tables and converted to pandas once; otherwise each file is
+        read with pandas and concatenated.
         
-        # Load noise manifest
-        noise_file = self.manifests_dir / 'manifest_noise.csv'
-        if noise_file.exists():
-            manifests['noise'] = pd.read_csv(noise_file)
+        Args:
+            sources: (model, condition, manifest_key, file_path) per result file
         
-        # Load tuning manifest (for class_tag)
-        tuning_file = self.manifests_dir / 'manifest_tuning.csv'
-        if tuning_file.exists():
-            manifests['tuning'] = pd.read_csv(tuning_file)
+        Returns:
+            DataFrame with filename, metric, model, condition and manifest_key columns
+        """
+        if not HAS_PYARROW:
+            frames = []
+            for model, condition, manifest_key, file_path in sources:
+                df = pd.read_csv(file_path, usecols=['filename'] + self.metrics)
+                df = df[df['filename'] != 'AVERAGE']
+                frames.append(df.assign(model=model, condition=condition, manifest_key=manifest_key))
+            return pd.concat(frames, ignore_index=True, sort=False)
         
-        return manifests
+        tables = []
+        for model, condition, manifest_key, file_path in sources:
+            table = self._read_table(file_path)
+            for name, value in (('model', model), ('condition', condition), ('manifest_key', manifest_key)):
+                table = table.append_column(name, pa.array([value] * table.num_rows, pa.string()))
+            tables.append(table)
+        return pa.concat_tables(tables).to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
     
     def load_results_with_metadata(self, manifests: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
         """
@@ -74,64 +185,42 @@ class AdditionalPlotter:
         Returns:
             Dictionary: {model: DataFrame with merged metadata}
         """
-        all_results = {}
-        
+        # Collect every (model, condition) result file to read
+        sources = []
         for model in self.models:
-            model_results = []
-            
-            # Load clean results
-            clean_file = self.results_dir / f"{model}_clean.csv"
-            if clean_file.exists():
-                df = pd.read_csv(clean_file)
-                df = df[df['filename'] != 'AVERAGE']
-                # Extract track_id from filename (remove .csv extension if present)
-                df['track_id'] = df['filename'].str.replace('.csv', '', regex=False).str.replace('.wav', '', regex=False)
-                df['condition'] = 'clean'
-                model_results.append(df)
-            
-            # Load distortion results
-            dist_file = self.results_dir / f"{model}_distortion.csv"
-            if dist_file.exists() and 'distortion' in manifests:
-                df = pd.read_csv(dist_file)
-                df = df[df['filename'] != 'AVERAGE']
-                df['track_id'] = df['filename'].str.replace('.csv', '', regex=False).str.replace('.wav', '', regex=False)
-                df['condition'] = 'distortion'
-                # Merge with distortion manifest
-                df = df.merge(manifests['distortion'][['track_id', 'level_tag', 'class_tag']], 
-                            on='track_id', how='left')
-                model_results.append(df)
-            
-            # Load noise results
-            for snr in ['5db', '15db']:
-                noise_file = self.results_dir / f"{model}_noise_{snr}.csv"
-                if noise_file.exists() and 'noise' in manifests:
-                    df = pd.read_csv(noise_file)
-                    df = df[df['filename'] != 'AVERAGE']
-                    df['track_id'] = df['filename'].str.replace('.csv', '', regex=False).str.replace('.wav', '', regex=False)
-                    df['condition'] = f'noise_{snr}'
-                    df['snr'] = snr
-                    # Merge with noise manifest
-                    df = df.merge(manifests['noise'][['track_id', 'noise_tag', 'class_tag']], 
-                                on='track_id', how='left')
-                    model_results.append(df)
-            
-            # Load pitch shift results
-            for cents in ['25cents', '50cents']:
-                pitch_file = self.results_dir / f"{model}_pitch_shift_{cents}.csv"
-                if pitch_file.exists() and 'tuning' in manifests:
-                    df = pd.read_csv(pitch_file)
-                    df = df[df['filename'] != 'AVERAGE']
-                    df['track_id'] = df['filename'].str.replace('.csv', '', regex=False).str.replace('.wav', '', regex=False)
-                    df['condition'] = f'pitch_shift_{cents}'
-                    # Merge with tuning manifest for class_tag
-                    df = df.merge(manifests['tuning'][['track_id', 'class_tag']], 
-                                on='track_id', how='left')
-                    model_results.append(df)
-            
-            if model_results:
-                all_results[model] = pd.concat(model_results, ignore_index=True)
-            else:
-                all_results[model] = None
+            for condition, manifest_key in self.result_sources:
+                file_path = self.results_dir / f"{model}_{condition}.csv"
+                if not file_path.exists():
+                    continue
+                if manifest_key is not None and manifest_key not in manifests:
+                    continue
+                sources.append((model, condition, manifest_key, file_path))
+        
+        all_results = {model: None for model in self.models}
+        if not sources:
+            return all_results
+        
+        all_df = self._read_results(sources)
+        # Extract track_id from filename (remove .csv/.wav extension if present).
+        # The same tracks recur across models/conditions, so strip each unique
+        # filename once and map the result back onto every row.
+        filenames = pd.Index(all_df['filename'].unique())
+        track_ids = filenames.str.replace(TRACK_ID_SUFFIX_PATTERN, '', regex=True)
+        all_df['track_id'] = all_df['filename'].map(dict(zip(filenames, track_ids)))
+        noise_rows = all_df['condition'].str.startswith('noise_')
+        all_df.loc[noise_rows, 'snr'] = all_df.loc[noise_rows, 'condition'].str.removeprefix('noise_')
+        
+        # One merge per manifest instead of one per (model, condition)
+        parts = [all_df[all_df['manifest_key'].isna()]]
+        for manifest_key, columns in self.manifest_columns.items():
+            part = all_df[all_df['manifest_key'] == manifest_key]
+            if len(part) > 0:
+                parts.append(part.merge(manifests[manifest_key][columns],
+                                        on='track_id', how='left', sort=False))
+        all_df = pd.concat(parts, ignore_index=True, sort=False).drop(columns='manifest_key')
+        
+        for model, df in all_df.groupby('model', sort=False):
+            all_results[model] = df.drop(columns='model').reset_index(drop=True)
         
         return all_results
     
@@ -143,87 +232,84 @@ class AdditionalPlotter:
             results: Loaded results with metadata
             output_dir: Directory to save figures
         """
+        self._plot_grouped(results,
+                           group_col='class_tag',
+                           group_order=['instrument', 'vocal'],
+                           x_labels=['Instrument', 'Vocal'],
+                           title_suffix=': Instrument vs Vocal',
+                           file_suffix='instrument_vocal',
+                           figsize=(10, 8),
+                           output_dir=output_dir)
+    
+    def plot_noise_types(self, results: Dict[str, pd.DataFrame], output_dir: str = "results/figures"):
+        """
+        Plot comparison across noise types (room/street/people).
+        
+        Args:
+            results: Loaded results with metadata
+            output_dir: Directory to save figures
+        """
+        self._plot_grouped(results,
+                           group_col='noise_tag',
+                           group_order=['room', 'street', 'people'],
+                           x_labels=['Room', 'Street', 'People'],
+                           title_suffix=' by Noise Type',
+                           file_suffix='noise_types',
+                           figsize=(12, 8),
+                           output_dir=output_dir)
+    
+    def _plot_grouped(self,
+                      results: Dict[str, pd.DataFrame],
+                      group_col: str,
+                      group_order: List[str],
+                      x_labels: List[str],
+                      title_suffix: str,
+                      file_suffix: str,
+                      figsize: tuple,
+                      output_dir: str):
+        """
+        Plot every metric grouped by a manifest column, one figure per metric.
+        
+        A single Figure/Axes is reused across metrics and cleared between them.
+        
+        Args:
+            results: Loaded results with metadata
+            group_col: Manifest column to group by (e.g. class_tag, noise_tag)
+            group_order: Group values in x-axis order
+            x_labels: Display labels for the groups
+            title_suffix: Text appended to the metric name in the title
+            file_suffix: Suffix of the output file name
+            figsize: Figure size
+            output_dir: Directory to save figures
+        """
+        self._lazy_init_mpl()
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
+        # Per-(model, group) statistics for every metric, computed once
+        stats, values = self._group_results(results, group_col)
+        
+        fig, ax = plt.subplots(figsize=figsize)
+        
         for metric in self.metrics:
-            fig, ax = plt.subplots(figsize=(10, 8))
-            
-            x_positions = {'instrument': 0, 'vocal': 1}
-            x_labels = ['Instrument', 'Vocal']
-            
-            # Collect all data across all conditions
-            for model_idx, model in enumerate(self.models):
-                if results[model] is None:
-                    continue
-                
-                df = results[model]
-                # Filter rows with class_tag
-                df_with_class = df[df['class_tag'].notna()].copy()
-                
-                if len(df_with_class) == 0:
-                    continue
-                
-                x_data = []
-                y_data = []
-                
-                for class_type in ['instrument', 'vocal']:
-                    class_data = df_with_class[df_with_class['class_tag'] == class_type]
-                    if len(class_data) > 0 and metric in class_data.columns:
-                        values = class_data[metric].dropna().values
-                        x_pos = x_positions[class_type] + (model_idx - 1) * 0.2
-                        x_data.extend([x_pos] * len(values))
-                        y_data.extend(values)
-                
-                if len(y_data) > 0:
-                    ax.scatter(x_data, y_data,
-                             c=self.colors[model],
-                             label=model.replace('_', ' ').title(),
-                             alpha=0.5,
-                             s=60,
-                             edgecolors='white',
-                             linewidths=0.8,
-                             zorder=3)
-                    
-                    # Plot statistics
-                    for class_type in ['instrument', 'vocal']:
-                        class_data = df_with_class[df_with_class['class_tag'] == class_type]
-                        if len(class_data) > 0 and metric in class_data.columns:
-                            values = class_data[metric].dropna().values
-                            if len(values) > 0:
-                                x_pos = x_positions[class_type] + (model_idx - 1) * 0.2
-                                median = np.median(values)
-                                mean = np.mean(values)
-                                
-                                ax.plot([x_pos - 0.15, x_pos + 0.15],
-                                       [median, median],
-                                       color=self.colors[model],
-                                       linewidth=3,
-                                       alpha=0.9,
-                                       zorder=4)
-                                
-                                ax.plot([x_pos - 0.15, x_pos + 0.15],
-                                       [mean, mean],
-                                       color=self.colors[model],
-                                       linewidth=2.5,
-                                       linestyle='--',
-                                       alpha=0.9,
-                                       zorder=4)
+            ax.clear()
+            if stats is not None:
+                self._draw_group_scatter(ax, stats, values, group_order, metric)
             
             # Set x-axis
-            ax.set_xticks([x_positions[c] for c in ['instrument', 'vocal']])
+            ax.set_xticks(range(len(group_order)))
             ax.set_xticklabels(x_labels, fontsize=12, fontweight='bold')
-            ax.set_xlim(-0.5, 1.5)
+            ax.set_xlim(-0.5, len(group_order) - 0.5)
             
             # Set y-axis
             ax.set_ylim(-0.05, 1.05)
             metric_name = self._get_metric_full_name(metric)
             ax.set_ylabel(f'{metric} Score', fontsize=13, fontweight='bold')
-            ax.set_yticks(np.arange(0, 1.1, 0.1))
-            ax.set_yticklabels([f'{v:.1f}' for v in np.arange(0, 1.1, 0.1)], fontsize=10)
+            ax.set_yticks(YTICKS)
+            ax.set_yticklabels(YTICK_LABELS, fontsize=10)
             
             # Set title
-            ax.set_title(f'{metric} - {metric_name}: Instrument vs Vocal',
+            ax.set_title(f'{metric} - {metric_name}{title_suffix}',
                         fontsize=15, fontweight='bold', pad=20)
             
             # Add grid and legend
@@ -237,130 +323,110 @@ class AdditionalPlotter:
                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
             
             plt.tight_layout()
-            output_file = output_path / f"{metric.lower()}_instrument_vocal.png"
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
+            output_file = output_path / f"{metric.lower()}_{file_suffix}.png"
+            plt.savefig(output_file, dpi=self.dpi, bbox_inches='tight')
             print(f"  ✓ Saved: {output_file}")
-            plt.close()
+        
+        plt.close(fig)
     
-    def plot_noise_types(self, results: Dict[str, pd.DataFrame], output_dir: str = "results/figures"):
+    def _group_results(self, results: Dict[str, pd.DataFrame], group_col: str):
         """
-        Plot comparison across noise types (room/street/people).
+        Group all models' results by (model, group) in a single pass.
         
         Args:
             results: Loaded results with metadata
-            output_dir: Directory to save figures
+            group_col: Manifest column to group by
+        
+        Returns:
+            Tuple of (stats, values): stats holds the per-(model, group) median,
+            mean and count of every metric; values maps metric -> (model, group)
+            -> non-NaN metric values. Both are None if no model has group_col.
         """
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        frames = [df.assign(model=model) for model, df in results.items()
+                  if df is not None and group_col in df.columns]
+        if not frames:
+            return None, None
         
-        for metric in self.metrics:
-            fig, ax = plt.subplots(figsize=(12, 8))
-            
-            x_positions = {'room': 0, 'street': 1, 'people': 2}
-            x_labels = ['Room', 'Street', 'People']
+        grouped = pd.concat(frames, ignore_index=True, sort=False).groupby(['model', group_col])
+        stats = grouped[self.metrics].agg(['median', 'mean', 'count'])
+        values = {metric: {key: group[metric].dropna().to_numpy() for key, group in grouped}
+                  for metric in self.metrics}
+        return stats, values
+    
+    def _draw_group_scatter(self,
+                            ax,
+                            stats: pd.DataFrame,
+                            values: Dict[str, Dict[tuple, np.ndarray]],
+                            group_order: List[str],
+                            metric: str):
+        """
+        Draw per-track scatter points plus median/mean lines for each model and group.
+        
+        Args:
+            ax: Axes to draw on
+            stats: Per-(model, group) statistics from _group_results
+            values: Per-metric, per-(model, group) values from _group_results
+            group_order: Group values in x-axis order
+            metric: Metric name (OA, RPA, RCA, or VR)
+        """
+        for model_idx, model in enumerate(self.models):
+            x_positions = []
+            group_values = []
+            model_stats = []
             
-            # Plot data for each model
-            for model_idx, model in enumerate(self.models):
-                if results[model] is None:
-                    continue
-                
-                df = results[model]
-                # Filter noise conditions
-                noise_df = df[df['condition'].str.startswith('noise_')].copy()
-                
-                if len(noise_df) == 0 or 'noise_tag' not in noise_df.columns:
+            for group_idx, group in enumerate(group_order):
+                key = (model, group)
+                if key not in stats.index or stats.loc[key, (metric, 'count')] == 0:
                     continue
-                
-                x_data = []
-                y_data = []
-                
-                for noise_type in ['room', 'street', 'people']:
-                    type_data = noise_df[noise_df['noise_tag'] == noise_type]
-                    if len(type_data) > 0 and metric in type_data.columns:
-                        values = type_data[metric].dropna().values
-                        x_pos = x_positions[noise_type] + (model_idx - 1) * 0.2
-                        x_data.extend([x_pos] * len(values))
-                        y_data.extend(values)
-                
-                if len(y_data) > 0:
-                    ax.scatter(x_data, y_data,
-                             c=self.colors[model],
-                             label=model.replace('_', ' ').title(),
-                             alpha=0.5,
-                             s=60,
-                             edgecolors='white',
-                             linewidths=0.8,
-                             zorder=3)
-                    
-                    # Plot statistics
-                    for noise_type in ['room', 'street', 'people']:
-                        type_data = noise_df[noise_df['noise_tag'] == noise_type]
-                        if len(type_data) > 0 and metric in type_data.columns:
-                            values = type_data[metric].dropna().values
-                            if len(values) > 0:
-                                x_pos = x_positions[noise_type] + (model_idx - 1) * 0.2
-                                median = np.median(values)
-                                mean = np.mean(values)
-                                
-                                ax.plot([x_pos - 0.15, x_pos + 0.15],
-                                       [median, median],
-                                       color=self.colors[model],
-                                       linewidth=3,
-                                       alpha=0.9,
-                                       zorder=4)
-                                
-                                ax.plot([x_pos - 0.15, x_pos + 0.15],
-                                       [mean, mean],
-                                       color=self.colors[model],
-                                       linewidth=2.5,
-                                       linestyle='--',
-                                       alpha=0.9,
-                                       zorder=4)
+                x_pos = group_idx + (model_idx - 1) * 0.2
+                x_positions.append(x_pos)
+                group_values.append(values[metric][key])
+                model_stats.append((x_pos,
+                                    stats.loc[key, (metric, 'median')],
+                                    stats.loc[key, (metric, 'mean')]))
             
-            # Set x-axis
-            ax.set_xticks([x_positions[n] for n in ['room', 'street', 'people']])
-            ax.set_xticklabels(x_labels, fontsize=12, fontweight='bold')
-            ax.set_xlim(-0.5, 2.5)
+            if len(group_values) == 0:
+                continue
             
-            # Set y-axis
-            ax.set_ylim(-0.05, 1.05)
-            metric_name = self._get_metric_full_name(metric)
-            ax.set_ylabel(f'{metric} Score', fontsize=13, fontweight='bold')
-            ax.set_yticks(np.arange(0, 1.1, 0.1))
-            ax.set_yticklabels([f'{v:.1f}' for v in np.arange(0, 1.1, 0.1)], fontsize=10)
+            # Dense x/y arrays straight from the grouped values
+            x_data = np.repeat(x_positions, [len(v) for v in group_values])
+            y_data = np.concatenate(group_values)
             
-            # Set title
-            ax.set_title(f'{metric} - {metric_name} by Noise Type',
-                        fontsize=15, fontweight='bold', pad=20)
+            ax.scatter(x_data, y_data,
+                     c=self.colors[model],
+                     label=model.replace('_', ' ').title(),
+                     alpha=0.5,
+                     s=60,
+                     edgecolors='white',
+                     linewidths=0.8,
+                     zorder=3,
+                     rasterized=True)
             
-            # Add grid and legend
-            ax.grid(True, alpha=0.3, linestyle='--', axis='y', zorder=0)
-            ax.legend(loc='upper left', frameon=True, fancybox=True, shadow=True, fontsize=11)
-            ax.text(0.02, 0.98,
-                   'Solid line: Median | Dashed line: Mean',
-                   transform=ax.transAxes,
-                   fontsize=9,
-                   verticalalignment='top',
-                   bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
-            
-            plt.tight_layout()
-            output_file = output_path / f"{metric.lower()}_noise_types.png"
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
-            print(f"  ✓ Saved: {output_file}")
-            plt.close()
+            # Plot statistics
+            for x_pos, median, mean in model_stats:
+                ax.plot([x_pos - 0.15, x_pos + 0.15],
+                       [median, median],
+                       color=self.colors[model],
+                       linewidth=3,
+                       alpha=0.9,
+                       zorder=4)
+                
+                ax.plot([x_pos - 0.15, x_pos + 0.15],
+                       [mean, mean],
+                       color=self.colors[model],
+                       linewidth=2.5,
+                       linestyle='--',
+                       alpha=0.9,
+                       zorder=4)
     
     def _get_metric_full_name(self, metric: str) -> str:
         """Get full name for metric."""
-        names = {
-            'OA': 'Overall Accuracy',
-            'RPA': 'Raw Pitch Accuracy',
-            'RCA': 'Raw Chroma Accuracy',
-            'VR': 'Voicing Recall'
-        }
-        return names.get(metric, metric)
+        return self.METRIC_FULL_NAMES.get(metric, metric)
     
     def plot_all(self, output_dir: str = "results/figures"):
         """Generate all additional comparison plots."""
+        self._lazy_init_mpl()
+        
         print("=" * 70)
         print("Loading manifests and evaluation results...")
         print("=" * 70)
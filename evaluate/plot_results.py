@@ -8,11 +8,15 @@ Creates 4 plots (one for each metric: OA, RPA, RCA, VR) showing:
 - Median and mean lines for each condition
 """
 
+import hashlib
+import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Optional
 
 # Try to import seaborn for better styling (optional)
 try:
@@ -22,6 +26,23 @@ try:
 except ImportError:
     HAS_SEABORN = False
 
+# Try to import pyarrow for CSV parsing and the Parquet results cache (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Trailing extensions stripped from result filenames to get the manifest track_id
+TRACK_ID_SUFFIX_PATTERN = r'(?:\.wav)?(?:\.csv)?$'
+
+# Version of the consolidated results layout; bump it whenever load_results
+# changes what it builds from the same CSVs, so stale caches are rebuilt
+CACHE_VERSION = 1
+
 # Set matplotlib style
 plt.rcParams['figure.figsize'] = (16, 8)
 plt.rcParams['font.size'] = 10
@@ -33,21 +54,44 @@ class ResultsPlotter:
     Plot evaluation results for multiple models and experimental conditions.
     """
     
-    def __init__(self, results_dir: str = "results/metrics"):
+    COLORS = {
+        'librosa': '#1f77b4',      # Blue
+        'crepe': '#ff7f0e',        # Orange
+        'basic_pitch': '#2ca02c'   # Green
+    }
+    
+    CONDITION_LABELS = {
+        'clean': 'Clean',
+        'distortion_light': 'Distortion\nLight',
+        'distortion_medium': 'Distortion\nMedium',
+        'distortion_heavy': 'Distortion\nHeavy',
+        'noise_5db': 'Noise 5dB',
+        'noise_15db': 'Noise 15dB',
+        'pitch_shift_25cents': 'Pitch Shift 25¢',
+        'pitch_shift_50cents': 'Pitch Shift 50¢'
+    }
+    
+    METRIC_FULL_NAMES = {
+        'OA': 'Overall Accuracy',
+        'RPA': 'Raw Pitch Accuracy',
+        'RCA': 'Raw Chroma Accuracy',
+        'VR': 'Voicing Recall'
+    }
+    
+    def __init__(self, results_dir: str = "results/metrics", dpi: int = 200):
         """
         Initialize plotter.
         
         Args:
             results_dir: Directory containing evaluation result CSV files
+            dpi: Resolution of saved figures (use 300 for final exports;
+                scatter points are rasterized)
         """
         self.results_dir = Path(results_dir)
+        self.dpi = dpi
         self.metrics = ['OA', 'RPA', 'RCA', 'VR']
         self.models = ['librosa', 'crepe', 'basic_pitch']
-        self.colors = {
-            'librosa': '#1f77b4',      # Blue
-            'crepe': '#ff7f0e',        # Orange
-            'basic_pitch': '#2ca02c'   # Green
-        }
+        self.colors = dict(self.COLORS)
         
         # Experimental conditions (in order)
         # Distortion is split into light/medium/heavy levels
@@ -63,200 +107,314 @@ class ResultsPlotter:
         ]
         
         # Display names for conditions
-        self.condition_labels = {
-            'clean': 'Clean',
-            'distortion_light': 'Distortion\nLight',
-            'distortion_medium': 'Distortion\nMedium',
-            'distortion_heavy': 'Distortion\nHeavy',
-            'noise_5db': 'Noise 5dB',
-            'noise_15db': 'Noise 15dB',
-            'pitch_shift_25cents': 'Pitch Shift 25¢',
-            'pitch_shift_50cents': 'Pitch Shift 50¢'
-        }
+        self.condition_labels = dict(self.CONDITION_LABELS)
+        
+        # Plot layout: one x slot per condition, models side by side within it
+        self.x_positions = {condition: i for i, condition in enumerate(self.conditions)}
+        self.model_offsets = {model: (model_idx - 1) * 0.2 for model_idx, model in enumerate(self.models)}
         
         # Manifest directory for distortion level information
         self.manifests_dir = Path("MedleyDB-Pitch-Experiments/manifests")
+        
+        # Consolidated long-form results, reused while the input CSVs are unchanged
+        self.cache_path = self.results_dir / '.cache.parquet'
+        
+        # Figure and artists reused across metrics (created by plot_metric)
+        self._artists = None
     
-    def load_results(self) -> Dict[str, Dict[str, pd.DataFrame]]:
+    def load_results(self) -> pd.DataFrame:
         """
-        Load all evaluation results.
+        Load all evaluation results into one long-form DataFrame.
         For distortion conditions, split by level (light/medium/heavy).
         
+        When pyarrow is available the result is cached as Parquet next to the
+        metrics, keyed by the path, mtime and size of every input CSV, so warm
+        runs skip CSV parsing entirely.
+        
         Returns:
-            Dictionary: {model: {condition: DataFrame}}
+            DataFrame with one row per evaluated file: filename, metric
+            columns (float32), plus 'model' and 'condition' (categorical)
         """
-        results = {}
+        source_hash = self._source_hash()
+        cached = self._read_cache(source_hash)
+        if cached is not None:
+            return cached
+        
+        all_df = self._load_csv_results()
+        all_df = all_df.astype({metric: 'float32' for metric in self.metrics})
+        all_df = all_df.astype({'filename': 'category', 'model': 'category', 'condition': 'category'})
+        self._write_cache(all_df, source_hash)
+        return all_df
+    
+    def _source_hash(self) -> str:
+        """
+        Hash the cache version, metrics/models/conditions and (path, mtime, size)
+        of every input CSV.
+        
+        Missing per-condition result files are reported here, so cached and
+        uncached runs print the same warnings.
+        """
+        # (path, warn if missing)
+        paths = [(self.manifests_dir / 'manifest_dist.csv', False)]
+        for model in self.models:
+            paths.append((self.results_dir / f"{model}_distortion.csv", False))
+            paths.extend((self.results_dir / f"{model}_{condition}.csv", True)
+                         for condition in self.conditions
+                         if not condition.startswith('distortion_'))
+        
+        entries = [CACHE_VERSION, self.metrics, self.models, self.conditions]
+        for path, warn_if_missing in paths:
+            try:
+                stat = path.stat()
+                entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                entries.append((str(path), None, None))
+                if warn_if_missing:
+                    print(f"Warning: {path} not found, skipping...")
+        return hashlib.sha256(repr(entries).encode()).hexdigest()
+    
+    def _read_cache(self, source_hash: str) -> Optional[pd.DataFrame]:
+        """Return the cached results if they were built from the current inputs."""
+        if not HAS_PYARROW or not self.cache_path.exists():
+            return None
+        try:
+            metadata = pq.read_schema(self.cache_path).metadata or {}
+            if metadata.get(b'source_hash') != source_hash.encode():
+                return None
+            return pq.read_table(self.cache_path).to_pandas()
+        except (OSError, pa.ArrowException):
+            return None
+    
+    def _write_cache(self, all_df: pd.DataFrame, source_hash: str):
+        """Store the results as Parquet, tagged with the input hash."""
+        if not HAS_PYARROW:
+            return
+        table = pa.Table.from_pandas(all_df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[b'source_hash'] = source_hash.encode()
+        try:
+            pq.write_table(table.replace_schema_metadata(metadata), self.cache_path)
+        except OSError as e:
+            print(f"Warning: could not write results cache {self.cache_path}: {e}")
+    
+    def _read_results_csv(self, file_path: Path) -> pd.DataFrame:
+        """
+        Read a result CSV without its AVERAGE summary row.
+        
+        Only the filename and metric columns are parsed, with fixed types (no
+        dtype inference). With pyarrow, the AVERAGE row is filtered on the
+        Arrow table before conversion.
+        """
+        if not HAS_PYARROW:
+            dtype = {'filename': 'string'}
+            dtype.update({metric: 'float32' for metric in self.metrics})
+            df = pd.read_csv(file_path, usecols=list(dtype), dtype=dtype, engine='c')
+            return df[df['filename'] != 'AVERAGE']
+        column_types = {'filename': pa.string()}
+        column_types.update({metric: pa.float32() for metric in self.metrics})
+        table = pacsv.read_csv(file_path,
+                               convert_options=pacsv.ConvertOptions(
+                                   include_columns=list(column_types),
+                                   column_types=column_types))
+        table = table.filter(pc.not_equal(table['filename'], 'AVERAGE'))
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    
+    def _load_csv_results(self) -> pd.DataFrame:
+        """Read the evaluation CSVs into one long-form DataFrame (see load_results)."""
+        frames = []
         
         # Load distortion manifest
         dist_manifest = None
         dist_manifest_path = self.manifests_dir / 'manifest_dist.csv'
         if dist_manifest_path.exists():
-            dist_manifest = pd.read_csv(dist_manifest_path)
+            dist_manifest = pd.read_csv(dist_manifest_path,
+                                        usecols=['track_id', 'level_tag'],
+                                        dtype={'track_id': 'string', 'level_tag': 'category'})
+        
+        # Result files to read: one distortion file per model (split by level
+        # below) plus one file per remaining condition
+        dist_paths = {}
+        file_paths = {}
+        for model in self.models:
+            if dist_manifest is not None:
+                dist_paths[model] = self.results_dir / f"{model}_distortion.csv"
+            for condition in self.conditions:
+                if not condition.startswith('distortion_'):
+                    file_paths[(model, condition)] = self.results_dir / f"{model}_{condition}.csv"
+        
+        # Read all existing files concurrently (CSV parsing releases the GIL)
+        all_paths = list(dist_paths.values()) + list(file_paths.values())
+        existing = [path for path in all_paths if path.exists()]
+        max_workers = min(16, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {path: executor.submit(self._read_results_csv, path) for path in existing}
+            loaded = {path: future.result() for path, future in futures.items()}
         
+        # Frames are popped from `loaded` as they are consumed, so each raw
+        # table is released as soon as its model has been processed
         for model in self.models:
-            results[model] = {}
+            model_frames = {}
+            
+            # Distortion: merge with the manifest once, then split by level
+            # (light, medium, heavy)
+            if dist_paths.get(model) in loaded:
+                df = loaded.pop(dist_paths[model])
+                # Extract track_id from filename
+                df = df.assign(track_id=df['filename'].str.replace(TRACK_ID_SUFFIX_PATTERN, '', regex=True))
+                # Merge with manifest to get level_tag
+                df = df.merge(dist_manifest, on='track_id', how='left')
+                for level, df_level in df.groupby('level_tag', observed=True, sort=False):
+                    # Remove helper columns
+                    model_frames[f'distortion_{level}'] = df_level.drop(columns=['track_id', 'level_tag'])
+            
+            # Handle other conditions normally
             for condition in self.conditions:
                 if condition.startswith('distortion_'):
-                    # Handle distortion levels separately
-                    level = condition.split('_')[1]  # light, medium, or heavy
-                    # Load the main distortion file
-                    file_path = self.results_dir / f"{model}_distortion.csv"
-                    
-                    if file_path.exists() and dist_manifest is not None:
-                        df = pd.read_csv(file_path)
-                        df = df[df['filename'] != 'AVERAGE']
-                        # Extract track_id from filename
-                        df['track_id'] = df['filename'].str.replace('.csv', '', regex=False).str.replace('.wav', '', regex=False)
-                        # Merge with manifest to get level_tag
-                        df = df.merge(dist_manifest[['track_id', 'level_tag']], on='track_id', how='left')
-                        # Filter by level
-                        df_level = df[df['level_tag'] == level].copy()
-                        if len(df_level) > 0:
-                            # Remove helper columns
-                            df_level = df_level.drop(['track_id', 'level_tag'], axis=1, errors='ignore')
-                            results[model][condition] = df_level
-                        else:
-                            results[model][condition] = None
-                    else:
-                        results[model][condition] = None
-                else:
-                    # Handle other conditions normally
-                    file_path = self.results_dir / f"{model}_{condition}.csv"
-                    
-                    if file_path.exists():
-                        df = pd.read_csv(file_path)
-                        # Remove AVERAGE row if exists
-                        df = df[df['filename'] != 'AVERAGE']
-                        results[model][condition] = df
-                    else:
-                        print(f"Warning: {file_path} not found, skipping...")
-                        results[model][condition] = None
-        
-        return results
+                    continue
+                # Missing files were already reported by _source_hash
+                file_path = file_paths[(model, condition)]
+                if file_path in loaded:
+                    model_frames[condition] = loaded.pop(file_path)
+            
+            for condition in self.conditions:
+                if condition in model_frames:
+                    frames.append(model_frames[condition].assign(model=model, condition=condition))
+        
+        if not frames:
+            return pd.DataFrame(columns=['filename'] + self.metrics + ['model', 'condition'])
+        return pd.concat(frames, ignore_index=True)
     
     def plot_metric(self,
                    metric: str,
-                   results: Dict[str, Dict[str, pd.DataFrame]],
-                   output_path: Optional[str] = None):
+                   results: pd.DataFrame,
+                   output_path: Optional[str] = None,
+                   stats: Optional[pd.DataFrame] = None):
         """
         Plot a single metric across all conditions and models.
         
+        The figure and its artists are created on first use and reused for
+        later metrics; only data, labels and annotations are updated.
+        
         Args:
             metric: Metric name (OA, RPA, RCA, or VR)
-            results: Loaded results dictionary
+            results: Long-form results from load_results
             output_path: Optional path to save figure
+            stats: Precomputed statistics from compute_stats (computed from
+                results if not given)
         """
+        if stats is None:
+            stats = self.compute_stats(results)
+        if self._artists is None:
+            self._setup_figure()
+        self._update_for_metric(metric, results, stats)
+        
+        fig = self._artists['fig']
+        
+        # Save figure
+        if output_path:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+            fig.savefig(output_path, dpi=self.dpi)
+            print(f"  ✓ Saved: {output_path}")
+        else:
+            plt.show()
+            self.close_figure()
+    
+    def __getstate__(self):
+        # The reused figure stays in this process; worker processes build their own
+        state = self.__dict__.copy()
+        state['_artists'] = None
+        return state
+    
+    def close_figure(self):
+        """Close the reused figure (a new one is created by the next plot)."""
+        if self._artists is not None:
+            plt.close(self._artists['fig'])
+            self._artists = None
+    
+    def _setup_figure(self):
+        """Create the figure, the static axes chrome and the per-metric artists."""
         fig, ax = plt.subplots(figsize=(16, 8))
+        # Fixed layout shared by every metric (replaces a tight_layout pass plus
+        # a bbox_inches='tight' render on every save)
+        fig.subplots_adjust(left=0.05, right=0.99, top=0.92, bottom=0.08)
+        self._setup_axes(ax)
         
-        # Prepare data for plotting
-        x_positions = {}
-        x_offset = 0
-        for condition in self.conditions:
-            x_positions[condition] = x_offset
-            x_offset += 1
+        artists = {'fig': fig, 'ax': ax, 'scatter': {}, 'median': {}, 'mean': {}, 'text': {}}
         
-        # Plot data for each model
         for model_idx, model in enumerate(self.models):
-            x_data = []
-            y_data = []
+            # Scatter plot (offsets are filled in per metric)
+            artists['scatter'][model] = ax.scatter([], [],
+                                                   c=self.colors[model],
+                                                   label=model.replace('_', ' ').title(),
+                                                   alpha=0.5,
+                                                   s=60,
+                                                   edgecolors='white',
+                                                   linewidths=0.8,
+                                                   zorder=3,
+                                                   rasterized=True)
             
             for condition in self.conditions:
-                if results[model][condition] is not None:
-                    df = results[model][condition]
-                    if metric in df.columns:
-                        values = df[metric].values
-                        # Add x positions with offset for each model (3 models centered around condition)
-                        x_pos = x_positions[condition] + (model_idx - 1) * 0.2
-                        x_data.extend([x_pos] * len(values))
-                        y_data.extend(values)
-            
-            if len(y_data) > 0:
-                # Scatter plot
-                ax.scatter(x_data, y_data, 
-                          c=self.colors[model], 
-                          label=model.replace('_', ' ').title(),
-                          alpha=0.5, 
-                          s=60,
-                          edgecolors='white',
-                          linewidths=0.8,
-                          zorder=3)
-        
-        # Calculate and plot statistics for each condition
-        for condition in self.conditions:
-            x_pos = x_positions[condition]
-            
-            for model_idx, model in enumerate(self.models):
-                if results[model][condition] is not None:
-                    df = results[model][condition]
-                    if metric in df.columns:
-                        values = df[metric].values
-                        if len(values) > 0:
-                            x_pos_model = x_pos + (model_idx - 1) * 0.2
-                            
-                            # Calculate statistics
-                            median = np.median(values)
-                            mean = np.mean(values)
-                            
-                            # Plot median line (thick solid)
-                            ax.plot([x_pos_model - 0.15, x_pos_model + 0.15], 
-                                   [median, median],
-                                   color=self.colors[model],
-                                   linewidth=3,
-                                   alpha=0.9,
-                                   zorder=4)
-                            
-                            # Plot mean line (dashed)
-                            ax.plot([x_pos_model - 0.15, x_pos_model + 0.15], 
-                                   [mean, mean],
-                                   color=self.colors[model],
-                                   linewidth=2.5,
-                                   linestyle='--',
-                                   alpha=0.9,
-                                   zorder=4)
-                            
-                            # Add text annotations (only show for middle model to reduce clutter)
-                            if model_idx == 1:  # Show for middle model (crepe)
-                                ax.text(x_pos_model, median + 0.03, 
-                                       f'M={median:.3f}',
-                                       fontsize=9,
-                                       ha='center',
-                                       color=self.colors[model],
-                                       weight='bold',
-                                       bbox=dict(boxstyle='round,pad=0.3', 
-                                               facecolor='white', 
-                                               alpha=0.8,
-                                               edgecolor=self.colors[model],
-                                               linewidth=1.5))
+                x_pos_model = self.x_positions[condition] + self.model_offsets[model]
+                x_data = [x_pos_model - 0.15, x_pos_model + 0.15]
+                
+                # Median line (thick solid)
+                artists['median'][(model, condition)], = ax.plot(x_data, [np.nan, np.nan],
+                                                                 color=self.colors[model],
+                                                                 linewidth=3,
+                                                                 alpha=0.9,
+                                                                 zorder=4)
+                
+                # Mean line (dashed)
+                artists['mean'][(model, condition)], = ax.plot(x_data, [np.nan, np.nan],
+                                                               color=self.colors[model],
+                                                               linewidth=2.5,
+                                                               linestyle='--',
+                                                               alpha=0.9,
+                                                               zorder=4)
+                
+                # Text annotations (only shown for middle model to reduce clutter)
+                if model_idx == 1:  # Show for middle model (crepe)
+                    artists['text'][(model, condition)] = ax.text(
+                        x_pos_model, 0, '',
+                        fontsize=9,
+                        ha='center',
+                        color=self.colors[model],
+                        weight='bold',
+                        visible=False,
+                        bbox=dict(boxstyle='round,pad=0.3',
+                                  facecolor='white',
+                                  alpha=0.8,
+                                  edgecolor=self.colors[model],
+                                  linewidth=1.5))
         
+        # Add legend
+        ax.legend(loc='upper left', 
+                 frameon=True, 
+                 fancybox=True, 
+                 shadow=True,
+                 fontsize=11,
+                 ncol=1)
+        
+        self._artists = artists
+    
+    def _setup_axes(self, ax):
+        """Draw the parts of the plot that are the same for every metric."""
         # Set x-axis
-        ax.set_xticks([x_positions[c] for c in self.conditions])
+        ax.set_xticks(range(len(self.conditions)))
         ax.set_xticklabels([self.condition_labels[c] for c in self.conditions],
                            fontsize=11, rotation=0, ha='center')
+        ax.set_xlim(-0.75, len(self.conditions) - 0.25)
         
         # Set y-axis
         ax.set_ylim(-0.05, 1.05)
-        ax.set_ylabel(f'{metric} Score', fontsize=13, fontweight='bold')
         ax.set_yticks(np.arange(0, 1.1, 0.1))
         ax.set_yticklabels([f'{v:.1f}' for v in np.arange(0, 1.1, 0.1)], fontsize=10)
         
-        # Set title
-        metric_name = self._get_metric_full_name(metric)
-        ax.set_title(f'{metric} - {metric_name}',
-                    fontsize=15, fontweight='bold', pad=20)
-        
         # Add grid
         ax.grid(True, alpha=0.3, linestyle='--', axis='y', zorder=0)
         ax.axhline(y=0, color='black', linewidth=0.8, zorder=0)
         ax.axhline(y=1, color='black', linewidth=0.8, zorder=0)
         
-        # Add legend
-        ax.legend(loc='upper left', 
-                 frameon=True, 
-                 fancybox=True, 
-                 shadow=True,
-                 fontsize=11,
-                 ncol=1)
-        
         # Add note about statistics
         ax.text(0.02, 0.98, 
                'Solid line: Median | Dashed line: Mean',
@@ -264,28 +422,64 @@ class ResultsPlotter:
                fontsize=9,
                verticalalignment='top',
                bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
+    
+    def compute_stats(self, results: pd.DataFrame) -> pd.DataFrame:
+        """
+        Median and mean of every metric for each (model, condition).
         
-        plt.tight_layout()
+        Returns:
+            DataFrame indexed by (model, condition) with (metric, 'median'/'mean')
+            columns, computed in one grouped pass over all metrics
+        """
+        return (results.groupby(['model', 'condition'], observed=True)[self.metrics]
+                .agg(['median', 'mean'])
+                .astype('float32'))
+    
+    def _update_for_metric(self, metric: str, results: pd.DataFrame, stats: pd.DataFrame):
+        """Update the existing artists with the data and labels of one metric."""
+        artists = self._artists
+        ax = artists['ax']
         
-        # Save figure
-        if output_path:
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
-            print(f"  ✓ Saved: {output_path}")
-        else:
-            plt.show()
+        # Prepare data for plotting: 3 models centered around each condition
+        data = results[['model', 'condition', metric]].dropna()
+        data = data.assign(x_pos=data['condition'].map(self.x_positions).astype(float)
+                                 + data['model'].map(self.model_offsets).astype(float))
+        
+        # Scatter points, one collection per model
+        for model, collection in artists['scatter'].items():
+            model_data = data[data['model'] == model]
+            collection.set_offsets(np.column_stack([model_data['x_pos'].to_numpy(),
+                                                    model_data[metric].to_numpy()]))
+        
+        # Statistics for each (model, condition)
+        for key, median_line in artists['median'].items():
+            mean_line = artists['mean'][key]
+            text = artists['text'].get(key)
+            has_stats = key in stats.index and not np.isnan(stats.loc[key, (metric, 'median')])
+            median_line.set_visible(has_stats)
+            mean_line.set_visible(has_stats)
+            if text is not None:
+                text.set_visible(has_stats)
+            if not has_stats:
+                continue
+            
+            median = stats.loc[key, (metric, 'median')]
+            mean = stats.loc[key, (metric, 'mean')]
+            median_line.set_ydata([median, median])
+            mean_line.set_ydata([mean, mean])
+            if text is not None:
+                text.set_y(median + 0.03)
+                text.set_text(f'M={median:.3f}')
         
-        plt.close()
+        # Set labels and title
+        ax.set_ylabel(f'{metric} Score', fontsize=13, fontweight='bold')
+        metric_name = self._get_metric_full_name(metric)
+        ax.set_title(f'{metric} - {metric_name}',
+                    fontsize=15, fontweight='bold', pad=20)
     
     def _get_metric_full_name(self, metric: str) -> str:
         """Get full name for metric."""
-        names = {
-            'OA': 'Overall Accuracy',
-            'RPA': 'Raw Pitch Accuracy',
-            'RCA': 'Raw Chroma Accuracy',
-            'VR': 'Voicing Recall'
-        }
-        return names.get(metric, metric)
+        return self.METRIC_FULL_NAMES.get(metric, metric)
     
     def plot_all_metrics(self, output_dir: str = "results/figures"):
         """
@@ -301,13 +495,9 @@ class ResultsPlotter:
         results = self.load_results()
         
         # Check which models and conditions have data
-        available = {}
         for model in self.models:
-            available[model] = []
-            for condition in self.conditions:
-                if results[model][condition] is not None:
-                    available[model].append(condition)
-            print(f"{model}: {len(available[model])} conditions")
+            n_conditions = results.loc[results['model'] == model, 'condition'].nunique()
+            print(f"{model}: {n_conditions} conditions")
         
         print("\n" + "=" * 60)
         print("Creating plots...")
@@ -316,11 +506,18 @@ class ResultsPlotter:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # Plot each metric
-        for metric in self.metrics:
-            print(f"\nPlotting {metric}...")
-            output_file = output_path / f"{metric.lower()}_comparison.png"
-            self.plot_metric(metric, results, str(output_file))
+        # Median/mean of all metrics, computed once and shared by every figure
+        stats = self.compute_stats(results)
+        
+        # Render the metrics in parallel worker processes; each worker gets the
+        # plotter, results and statistics once and reuses its own figure across
+        # metrics
+        print(f"\nPlotting {', '.join(self.metrics)}...")
+        max_workers = min(len(self.metrics), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(self, results, stats)) as executor:
+            list(executor.map(partial(_render_one, str(output_path)), self.metrics))
         
         print("\n" + "=" * 60)
         print("All plots created successfully!")
@@ -328,6 +525,25 @@ class ResultsPlotter:
         print("=" * 60)
 
 
+# Per-process state for the parallel renderers in plot_all_metrics
+_worker_state = {}
+
+
+def _init_worker(plotter: ResultsPlotter, results: pd.DataFrame, stats: pd.DataFrame):
+    """Store the plotter, results and statistics once per worker process."""
+    _worker_state['plotter'] = plotter
+    _worker_state['results'] = results
+    _worker_state['stats'] = stats
+
+
+def _render_one(output_dir: str, metric: str) -> str:
+    """Render and save one metric's figure in a worker process."""
+    output_file = Path(output_dir) / f"{metric.lower()}_comparison.png"
+    _worker_state['plotter'].plot_metric(metric, _worker_state['results'], str(output_file),
+                                         stats=_worker_state['stats'])
+    return str(output_file)
+
+
 def main():
     """Main function."""
     plotter = ResultsPlotter(results_dir="results/metrics")
@@ -3,18 +3,25 @@
 检查数据集结构完整性
 """
 
+import os
 from pathlib import Path
 import sys
 
 def check_directory(path, description):
-    """检查目录是否存在"""
+    """检查目录是否存在，并在一次扫描中统计文件、WAV和CSV数量"""
     p = Path(path)
-    if p.exists() and p.is_dir():
-        files = list(p.glob("*"))
-        wav_files = list(p.glob("*.wav"))
-        csv_files = list(p.glob("*.csv"))
-        return True, len(files), len(wav_files), len(csv_files)
-    return False, 0, 0, 0
+    if not (p.exists() and p.is_dir()):
+        return False, 0, 0, 0
+    total = wav_count = csv_count = 0
+    with os.scandir(p) as it:
+        for entry in it:
+            total += 1
+            name = entry.name
+            if name.endswith(".wav"):
+                wav_count += 1
+            elif name.endswith(".csv"):
+                csv_count += 1
+    return True, total, wav_count, csv_count
 
 def main():
     print("=" * 70)
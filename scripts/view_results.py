@@ -7,7 +7,8 @@ Usage: python scripts/view_results.py [results_path]
 import os
 import sys
 from pathlib import Path
-from collections import defaultdict
+import bisect
+from collections import Counter
 
 
 def format_size(size_bytes):
@@ -19,40 +20,99 @@ def format_size(size_bytes):
     return f"{size_bytes:.2f} PB"
 
 
-def count_files(directory):
-    """Count files in a directory"""
-    return len([f for f in directory.iterdir() if f.is_file()])
+def _count_files(directory):
+    """Count files directly inside a directory"""
+    try:
+        with os.scandir(directory) as it:
+            return sum(1 for entry in it if entry.is_file())
+    except (PermissionError, OSError):
+        return 0
+
 
+def _walk_once(root, num_samples=10):
+    """Walk directory tree once, collecting file counts, dirs, sizes and file types
 
-def get_dir_size(directory):
-    """Get total size of directory"""
-    total = 0
+    Returns (num_files, dirs, total_size, dir_file_counts, file_types,
+    csv_samples), where dir_file_counts maps every directory (root included)
+    to the number of files directly inside it and csv_samples holds the
+    (relative path, size) of the first num_samples CSV files in path order.
+    Symlinked files are counted with their target's size; symlinked
+    directories are listed and counted but not descended into.
+    """
+    num_files = 0
+    dirs = []
+    dir_file_counts = {}
+    file_types = Counter()
+    csv_samples = []
+    total_size = 0
+
+    # Directories still to list, with their path parts relative to root
+    stack = [(Path(root), ())]
+    while stack:
+        directory, rel_parts = stack.pop()
+        file_count = 0
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_file():
+                        name = entry.name
+                        size = entry.stat().st_size
+                        ext = os.path.splitext(name)[1]
+                        if ext == ".":
+                            ext = ""  # Path.suffix ignores a trailing dot
+                        file_types[ext or "(no extension)"] += 1
+                        if ext == '.csv':
+                            # Compare relative path parts, as Path ordering does
+                            sample = (rel_parts + (name,), size)
+                            if len(csv_samples) < num_samples or sample < csv_samples[-1]:
+                                bisect.insort(csv_samples, sample)
+                                del csv_samples[num_samples:]
+                        total_size += size
+                        file_count += 1
+                        num_files += 1
+                    elif entry.is_dir():
+                        sub_dir = Path(entry.path)
+                        dirs.append(sub_dir)
+                        if entry.is_symlink():
+                            dir_file_counts[sub_dir] = _count_files(sub_dir)
+                        else:
+                            stack.append((sub_dir, rel_parts + (entry.name,)))
+        except (PermissionError, OSError):
+            pass
+        dir_file_counts[directory] = file_count
+
+    csv_samples = [(Path(*parts), size) for parts, size in csv_samples]
+    return num_files, dirs, total_size, dir_file_counts, file_types, csv_samples
+
+
+def _sorted_entries(directory):
+    """List a directory with subdirectories first, then by name"""
     try:
-        for entry in directory.rglob('*'):
-            if entry.is_file():
-                total += entry.stat().st_size
+        with os.scandir(directory) as it:
+            return sorted(it, key=lambda entry: (entry.is_file(), entry.name))
     except (PermissionError, OSError):
-        pass
-    return total
+        return []
 
 
-def print_tree(directory, prefix="", max_depth=4, current_depth=0):
+def print_tree(directory, max_depth=4):
     """Print directory tree structure"""
-    if current_depth >= max_depth:
-        return
-    
-    try:
-        entries = sorted(directory.iterdir(), key=lambda x: (x.is_file(), x.name))
-        for i, entry in enumerate(entries):
-            is_last = i == len(entries) - 1
+    # Entries still to print as (entry, prefix, is_last, depth); the root is
+    # only expanded, and children are pushed in reverse so they pop in order
+    stack = [(directory, "", True, -1)]
+    while stack:
+        entry, prefix, is_last, depth = stack.pop()
+        if depth >= 0:
             current_prefix = "└── " if is_last else "├── "
             print(f"{prefix}{current_prefix}{entry.name}")
-            
-            if entry.is_dir():
-                next_prefix = prefix + ("    " if is_last else "│   ")
-                print_tree(entry, next_prefix, max_depth, current_depth + 1)
-    except (PermissionError, OSError):
-        pass
+            if not entry.is_dir():
+                continue
+            prefix += "    " if is_last else "│   "
+        
+        if depth + 1 >= max_depth:
+            continue
+        entries = _sorted_entries(entry)
+        for i in range(len(entries) - 1, -1, -1):
+            stack.append((entries[i], prefix, i == len(entries) - 1, depth + 1))
 
 
 def main():
@@ -98,15 +158,14 @@ def main():
     print_tree(results_path, max_depth=4)
     print()
     
+    # Walk the tree once and reuse the results for every section below
+    num_files, dirs, total_size, dir_file_counts, file_types, csv_samples = _walk_once(results_path)
+    
     # Count total files
     print("=" * 60)
     print("File Statistics")
     print("=" * 60)
-    all_files = list(results_path.rglob("*"))
-    files = [f for f in all_files if f.is_file()]
-    dirs = [d for d in all_files if d.is_dir()]
-    
-    print(f"Total files: {len(files)}")
+    print(f"Total files: {num_files}")
     print(f"Total directories: {len(dirs)}")
     print()
     
@@ -114,15 +173,14 @@ def main():
     print("=" * 60)
     print("Files per Directory")
     print("=" * 60)
-    dir_file_counts = {}
-    for directory in dirs:
-        file_count = count_files(directory)
-        if file_count > 0:
-            rel_path = directory.relative_to(results_path)
-            dir_file_counts[rel_path] = file_count
+    nonempty_dirs = {
+        directory.relative_to(results_path): dir_file_counts[directory]
+        for directory in dirs
+        if dir_file_counts[directory] > 0
+    }
     
     # Sort by file count
-    for dir_path, count in sorted(dir_file_counts.items(), key=lambda x: x[1], reverse=True):
+    for dir_path, count in sorted(nonempty_dirs.items(), key=lambda x: (-x[1], str(x[0]))):
         print(f"  {str(dir_path):<60} {count:>5} files")
     print()
     
@@ -130,61 +188,42 @@ def main():
     print("=" * 60)
     print("Breakdown by Model/Experiment")
     print("=" * 60)
-    predictions_dir = results_path / "predictions"
-    if predictions_dir.exists():
-        for model_dir in sorted(predictions_dir.iterdir()):
-            if model_dir.is_dir():
-                model_name = model_dir.name
-                print(f"\n{model_name}:")
-                
-                # Count files in each experiment subdirectory
-                exp_counts = {}
-                for exp_dir in model_dir.rglob("*"):
-                    if exp_dir.is_dir() and exp_dir != model_dir:
-                        file_count = count_files(exp_dir)
-                        if file_count > 0:
-                            rel_exp = exp_dir.relative_to(model_dir)
-                            exp_counts[rel_exp] = file_count
-                
-                for exp_path, count in sorted(exp_counts.items(), key=lambda x: x[1], reverse=True):
-                    print(f"  └─ {str(exp_path):<50} {count:>5} files")
+    # Group directories under predictions/<model> in one pass over the walk
+    model_exp_counts = {}
+    for directory in dirs:
+        parts = directory.relative_to(results_path).parts
+        if len(parts) < 2 or parts[0] != "predictions":
+            continue
+        exp_counts = model_exp_counts.setdefault(parts[1], {})
+        if len(parts) > 2 and dir_file_counts[directory] > 0:
+            exp_counts[Path(*parts[2:])] = dir_file_counts[directory]
+    
+    for model_name, exp_counts in sorted(model_exp_counts.items()):
+        print(f"\n{model_name}:")
+        for exp_path, count in sorted(exp_counts.items(), key=lambda x: (-x[1], str(x[0]))):
+            print(f"  └─ {str(exp_path):<50} {count:>5} files")
     print()
     
     # Disk usage
     print("=" * 60)
     print("Disk Usage")
     print("=" * 60)
-    try:
-        total_size = get_dir_size(results_path)
-        print(f"Total size: {format_size(total_size)}")
-    except Exception as e:
-        print(f"Unable to calculate disk usage: {e}")
+    print(f"Total size: {format_size(total_size)}")
     print()
     
     # Sample files
     print("=" * 60)
     print("Sample Files (first 10)")
     print("=" * 60)
-    csv_files = [f for f in files if f.suffix == '.csv']
-    for file_path in sorted(csv_files)[:10]:
-        rel_file = file_path.relative_to(results_path)
-        try:
-            size = file_path.stat().st_size
-            print(f"  {str(rel_file):<60} {format_size(size)}")
-        except Exception:
-            print(f"  {str(rel_file):<60} (size unknown)")
+    for rel_file, size in csv_samples:
+        print(f"  {str(rel_file):<60} {format_size(size)}")
     print()
     
     # File type summary
     print("=" * 60)
     print("File Type Summary")
     print("=" * 60)
-    file_types = defaultdict(int)
-    for file_path in files:
-        ext = file_path.suffix or "(no extension)"
-        file_types[ext] += 1
-    
-    for ext, count in sorted(file_types.items(), key=lambda x: x[1], reverse=True):
+    for ext, count in sorted(file_types.items(), key=lambda x: (-x[1], x[0])):
         print(f"  {ext:<20} {count:>5} files")
     print()
     